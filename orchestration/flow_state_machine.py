@@ -27,6 +27,13 @@ class RoleState(Enum):
     FAILED = "failed"
 
 
+# Dense ordinal (declaration order) used to index the transition tables,
+# assigned once the enum classes are complete.
+for _states in (FlowState, RoleState):
+    for _i, _state in enumerate(_states):
+        _state.ordinal = _i
+
+
 class StateTransitionError(Exception):
     """Raised when an invalid state transition is attempted."""
     pass
@@ -45,14 +52,17 @@ class FlowStateMachine:
     - FAILED -> ARCHIVED (when failure is recorded)
     """
     
+    __slots__ = ("state",)
+
     VALID_TRANSITIONS = {
-        FlowState.CREATED: {FlowState.PENDING},
-        FlowState.PENDING: {FlowState.RUNNING},
-        FlowState.RUNNING: {FlowState.COMPLETED, FlowState.FAILED},
-        FlowState.COMPLETED: {FlowState.ARCHIVED},
-        FlowState.FAILED: {FlowState.ARCHIVED},
-        FlowState.ARCHIVED: set(),  # Terminal state
+        FlowState.CREATED: frozenset({FlowState.PENDING}),
+        FlowState.PENDING: frozenset({FlowState.RUNNING}),
+        FlowState.RUNNING: frozenset({FlowState.COMPLETED, FlowState.FAILED}),
+        FlowState.COMPLETED: frozenset({FlowState.ARCHIVED}),
+        FlowState.FAILED: frozenset({FlowState.ARCHIVED}),
+        FlowState.ARCHIVED: frozenset(),  # Terminal state
     }
+    TERMINAL_STATES = frozenset({FlowState.ARCHIVED})
     
     def __init__(self, initial_state: FlowState = FlowState.CREATED):
         self.state = initial_state
@@ -67,7 +77,7 @@ class FlowStateMachine:
         Raises:
             StateTransitionError: If the transition is invalid
         """
-        if new_state not in self.VALID_TRANSITIONS.get(self.state, set()):
+        if not self.can_transition(new_state):
             raise StateTransitionError(
                 f"Invalid transition from {self.state.value} to {new_state.value}"
             )
@@ -75,12 +85,13 @@ class FlowStateMachine:
     
     def can_transition(self, new_state: FlowState) -> bool:
         """Check if a transition is valid without performing it."""
-        return new_state in self.VALID_TRANSITIONS.get(self.state, set())
+        # Ordinals are only meaningful within FlowState; other enums never match
+        return type(new_state) is FlowState and _FLOW_TABLE[self.state.ordinal * _FLOW_N + new_state.ordinal] != 0
     
     @property
     def is_terminal(self) -> bool:
         """Check if the current state is terminal (no further transitions)."""
-        return len(self.VALID_TRANSITIONS.get(self.state, set())) == 0
+        return self.state in self.TERMINAL_STATES
 
 
 class RoleStateMachine:
@@ -93,12 +104,15 @@ class RoleStateMachine:
     - RUNNING -> FAILED (when role encounters an error)
     """
     
+    __slots__ = ("state",)
+
     VALID_TRANSITIONS = {
-        RoleState.PENDING: {RoleState.RUNNING},
-        RoleState.RUNNING: {RoleState.COMPLETED, RoleState.FAILED},
-        RoleState.COMPLETED: set(),  # Terminal state
-        RoleState.FAILED: set(),  # Terminal state
+        RoleState.PENDING: frozenset({RoleState.RUNNING}),
+        RoleState.RUNNING: frozenset({RoleState.COMPLETED, RoleState.FAILED}),
+        RoleState.COMPLETED: frozenset(),  # Terminal state
+        RoleState.FAILED: frozenset(),  # Terminal state
     }
+    TERMINAL_STATES = frozenset({RoleState.COMPLETED, RoleState.FAILED})
     
     def __init__(self, initial_state: RoleState = RoleState.PENDING):
         self.state = initial_state
@@ -113,7 +127,7 @@ class RoleStateMachine:
         Raises:
             StateTransitionError: If the transition is invalid
         """
-        if new_state not in self.VALID_TRANSITIONS.get(self.state, set()):
+        if not self.can_transition(new_state):
             raise StateTransitionError(
                 f"Invalid role transition from {self.state.value} to {new_state.value}"
             )
@@ -121,9 +135,25 @@ class RoleStateMachine:
     
     def can_transition(self, new_state: RoleState) -> bool:
         """Check if a transition is valid without performing it."""
-        return new_state in self.VALID_TRANSITIONS.get(self.state, set())
+        # Ordinals are only meaningful within RoleState; other enums never match
+        return type(new_state) is RoleState and _ROLE_TABLE[self.state.ordinal * _ROLE_N + new_state.ordinal] != 0
     
     @property
     def is_terminal(self) -> bool:
         """Check if the current state is terminal (no further transitions)."""
-        return len(self.VALID_TRANSITIONS.get(self.state, set())) == 0
+        return self.state in self.TERMINAL_STATES
+
+
+def _build_table(transitions: dict, n: int) -> bytearray:
+    """Flatten a transition dict into an n*n table indexed by src*n + dst."""
+    table = bytearray(n * n)
+    for src, targets in transitions.items():
+        for dst in targets:
+            table[src.ordinal * n + dst.ordinal] = 1
+    return table
+
+
+_FLOW_N = len(FlowState)
+_FLOW_TABLE = _build_table(FlowStateMachine.VALID_TRANSITIONS, _FLOW_N)
+_ROLE_N = len(RoleState)
+_ROLE_TABLE = _build_table(RoleStateMachine.VALID_TRANSITIONS, _ROLE_N)
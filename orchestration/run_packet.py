@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import datetime as dt
+import functools
 from pathlib import Path
+import re
 
 try:
     import yaml
 except Exception:
     yaml = None
 
+_UTC = dt.UTC
+BRIEF_TEMPLATE = Path("templates") / "brief.md.tmpl"
+
 ROLES = {
     "architect": {"responsibilities": "Define architecture changes, contracts, non-goals.", "output": "01-architecture.md"},
     "builder": {"responsibilities": "Implement approved scope (code/config).", "output": "02-implementation.md"},
@@ -20,7 +26,8 @@ ROLES = {
 def load_roles(base: Path):
     roster = base.parent / "roster" / "roles.yaml"
     if yaml and roster.exists():
-        data = yaml.safe_load(roster.read_text()) or {}
+        with roster.open("rb") as f:
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
         roles = {}
         for r in data.get("roles", []):
             roles[r["id"]] = {
@@ -32,23 +39,51 @@ def load_roles(base: Path):
     return ROLES
 
 
-def render(template: str, values: dict[str, str]) -> str:
-    out = template
-    for k, v in values.items():
-        out = out.replace("{{" + k + "}}", v)
-    return out
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+@functools.lru_cache(maxsize=8)
+def template_tokens(path_str: str, mtime: float) -> tuple[bytes | str, ...]:
+    # Encoded literal chunks at even indices, placeholder names at odd indices.
+    parts = _PLACEHOLDER_RE.split(Path(path_str).read_text())
+    return tuple(t if i % 2 else t.encode() for i, t in enumerate(parts))
+
+
+def render(tokens: tuple[bytes | str, ...], values: dict[str, str]) -> bytes:
+    # Only role-specific values are encoded per call; unknown placeholders are left as-is.
+    return b"".join(
+        values.get(t, "{{" + t + "}}").encode() if i % 2 else t
+        for i, t in enumerate(tokens)
+    )
+
+
+def mark_latest(run_dir: Path):
+    # Pointer to the newest run so cron can skip scanning every run dir.
+    pointer = run_dir.parent / ".latest"
+    tmp = pointer.with_name(".latest.tmp")
+    tmp.write_bytes(run_dir.name.encode())
+    tmp.replace(pointer)
+
+
+def write_files(writes: dict[Path, bytes]):
+    # Keys are unique paths, so the writes can overlap without coordination.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(lambda pw: pw[0].write_bytes(pw[1]), writes.items()))
 
 
 def create_run(base: Path, objective: str, criteria: list[str], scope: str, run_id: str | None):
-    now = dt.datetime.now(dt.UTC)
+    now = dt.datetime.now(_UTC)
     run_id = run_id or now.strftime("run-%Y%m%d-%H%M%S")
     run_dir = base / "runs" / run_id
     run_dir.mkdir(parents=True, exist_ok=False)
+    mark_latest(run_dir)
 
-    template = (base / "templates" / "brief.md.tmpl").read_text()
     ac_text = "\n".join([f"- {c}" for c in criteria]) if criteria else "- (none provided)"
 
-    (run_dir / "RUN.md").write_text(
+    # Build every file in memory first (later entries win, e.g. FINAL.md
+    # when it is also a role output), then write them in one batch.
+    writes: dict[Path, bytes] = {}
+    writes[run_dir / "RUN.md"] = (
         "# Run\n\n"
         f"- ID: {run_id}\n"
         f"- Created (UTC): {now.isoformat()}\n"
@@ -57,11 +92,13 @@ def create_run(base: Path, objective: str, criteria: list[str], scope: str, run_
         f"{ac_text}\n\n"
         "## Scope\n"
         f"{scope}\n"
-    )
+    ).encode()
 
-    roles = load_roles(base)
+    roles = load_roles(base)  # never empty: falls back to ROLES
+    template_path = base / BRIEF_TEMPLATE
+    tokens = template_tokens(str(template_path), template_path.stat().st_mtime)
     for role, meta in roles.items():
-        content = render(template, {
+        content = render(tokens, {
             "role": role,
             "run_id": run_id,
             "objective": objective,
@@ -70,27 +107,29 @@ def create_run(base: Path, objective: str, criteria: list[str], scope: str, run_
             "responsibilities": meta["responsibilities"],
             "output_file": meta["output"],
         })
-        (run_dir / f"brief-{role}.md").write_text(content)
-        (run_dir / meta["output"]).write_text(f"# {role} output\n\nPending.\n")
-
-    (run_dir / "CHECKLIST.md").write_text(
-        "# Integration Checklist\n\n"
-        "- [ ] Architecture output complete\n"
-        "- [ ] Implementation complete\n"
-        "- [ ] Data compatibility confirmed\n"
-        "- [ ] Tests added/executed\n"
-        "- [ ] Docs updated\n"
-        "- [ ] Gates passed\n"
-        "- [ ] FINAL.md written\n"
+        writes[run_dir / f"brief-{role}.md"] = content
+        writes[run_dir / meta["output"]] = f"# {role} output\n\nPending.\n".encode()
+
+    writes[run_dir / "CHECKLIST.md"] = (
+        b"# Integration Checklist\n\n"
+        b"- [ ] Architecture output complete\n"
+        b"- [ ] Implementation complete\n"
+        b"- [ ] Data compatibility confirmed\n"
+        b"- [ ] Tests added/executed\n"
+        b"- [ ] Docs updated\n"
+        b"- [ ] Gates passed\n"
+        b"- [ ] FINAL.md written\n"
     )
 
-    (run_dir / "FINAL.md").write_text(
-        "# Final Summary\n\n"
-        "## Changes\n- TBD\n\n"
-        "## Deferred\n- TBD\n\n"
-        "## Blockers\n- None\n"
+    writes[run_dir / "FINAL.md"] = (
+        b"# Final Summary\n\n"
+        b"## Changes\n- TBD\n\n"
+        b"## Deferred\n- TBD\n\n"
+        b"## Blockers\n- None\n"
     )
 
+    write_files(writes)
+
     print(run_dir)
 
 
@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
 from pathlib import Path
 import subprocess
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 RUNS = ROOT / "orchestration" / "runs"
+READY_CACHE = RUNS / ".ready_cache.json"
 
 REQUIRED = {
     "01-architecture.md",
@@ -18,26 +27,67 @@ REQUIRED = {
 
 
 def ready(run_dir: Path) -> bool:
-    if not REQUIRED.issubset({p.name for p in run_dir.iterdir() if p.is_file()}):
+    with os.scandir(run_dir) as it:
+        names = {e.name for e in it if e.is_file()}
+    if not REQUIRED.issubset(names):
         return False
-    text = (run_dir / "CHECKLIST.md").read_text()
-    return "- [ ]" in text  # only approve if not already complete
+    # Substring test on raw bytes; no need to decode the checklist
+    return b"- [ ]" in (run_dir / "CHECKLIST.md").read_bytes()  # only approve if not already complete
+
+
+def ready_key(run_dir: Path) -> str:
+    # Dir mtime covers files added/removed; CHECKLIST.md mtime covers in-place edits
+    try:
+        checklist_mtime = (run_dir / "CHECKLIST.md").stat().st_mtime_ns
+    except FileNotFoundError:
+        checklist_mtime = 0
+    return f"{run_dir.stat().st_mtime_ns}:{checklist_mtime}"
+
+
+def load_ready_cache() -> dict[str, str]:
+    try:
+        raw = READY_CACHE.read_bytes()
+        return orjson.loads(raw) if orjson else json.loads(raw)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_ready_cache(cache: dict[str, str]):
+    tmp = READY_CACHE.with_name(READY_CACHE.name + ".tmp")
+    tmp.write_bytes(orjson.dumps(cache) if orjson else json.dumps(cache).encode())
+    tmp.replace(READY_CACHE)
 
 
 def main():
-    if not RUNS.exists():
+    try:
+        with os.scandir(RUNS) as it:
+            run_dirs = [Path(e.path) for e in it if e.is_dir()]
+    except FileNotFoundError:
         return
-    for run_dir in RUNS.iterdir():
-        if not run_dir.is_dir():
+
+    # Only "not ready" results are cached; a ready run gets approved and changes anyway
+    cache = load_ready_cache()
+    new_cache: dict[str, str] = {}
+    cmds = []
+    for run_dir in run_dirs:
+        key = ready_key(run_dir)
+        if cache.get(run_dir.name) == key:
+            new_cache[run_dir.name] = key
             continue
         if ready(run_dir):
-            subprocess.run([
-                "python3",
-                str(ROOT / "scripts" / "pipeline.py"),
-                "approve",
-                "--run-id",
-                run_dir.name,
-            ], check=True)
+            cmds.append(["python3", str(ROOT / "scripts" / "pipeline.py"), "approve", "--run-id", run_dir.name])
+        else:
+            new_cache[run_dir.name] = key
+    if new_cache != cache:
+        save_ready_cache(new_cache)
+
+    if not cmds:
+        return
+    # Approvals touch independent run dirs; overlap the subprocess waits
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        futures = [ex.submit(subprocess.run, cmd, check=True) for cmd in cmds]
+        for f in futures:
+            f.result()
 
 
 if __name__ == "__main__":
@@ -1,29 +1,45 @@
 #!/usr/bin/env python3
 from __future__ import annotations
+import os
 from pathlib import Path
-import subprocess
-import yaml
+import sys
 
 ROOT = Path('/root/.openclaw/workspace/pipeline-core')
 ORCH_RUNS = ROOT / 'orchestration' / 'runs'
 AGENTS = ROOT / 'agents'
-ROSTER = ROOT / 'roster' / 'roles.yaml'
+LATEST = ORCH_RUNS / '.latest'
+
+# Call pipeline stages in-process instead of re-launching the interpreter
+sys.path.insert(0, str(ROOT / 'scripts'))
+import pipeline  # noqa: E402
 
 
 def latest_run_id():
-    if not ORCH_RUNS.exists():
+    # Fast path: pointer written by run_packet.create_run
+    try:
+        run_id = LATEST.read_text().strip()
+    except FileNotFoundError:
+        run_id = ''
+    if run_id and (ORCH_RUNS / run_id).is_dir():
+        return run_id
+
+    try:
+        with os.scandir(ORCH_RUNS) as it:
+            runs = [(e.name, e.stat().st_mtime) for e in it if e.is_dir()]
+    except FileNotFoundError:
         return None
-    runs = [p for p in ORCH_RUNS.iterdir() if p.is_dir()]
     if not runs:
         return None
-    runs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return runs[0].name
+    run_id = max(runs, key=lambda r: r[1])[0]
+    tmp = LATEST.with_name('.latest.tmp')
+    tmp.write_text(run_id)
+    tmp.replace(LATEST)
+    return run_id
 
 
 def load_roster():
-    if not ROSTER.exists():
-        return {}
-    return yaml.safe_load(ROSTER.read_text()) or {}
+    # Shared with pipeline.py: parsed once per roles.yaml change via a JSON sidecar
+    return pipeline.load_roster()
 
 
 def required_outputs(roster: dict) -> list[str]:
@@ -37,10 +53,14 @@ def required_outputs(roster: dict) -> list[str]:
 
 
 def outputs_exist(run_id: str, outputs: list[str]) -> bool:
-    run_dir = ORCH_RUNS / run_id
-    if not run_dir.exists():
+    if not outputs:
+        return True
+    try:
+        with os.scandir(ORCH_RUNS / run_id) as it:
+            names = {e.name for e in it}
+    except FileNotFoundError:
         return False
-    return all((run_dir / name).exists() for name in outputs)
+    return names.issuperset(outputs)
 
 
 def main():
@@ -49,21 +69,28 @@ def main():
         return
 
     # Run orchestrate (writes spawn_request.json when needed)
-    subprocess.run(['python3', str(ROOT / 'scripts' / 'pipeline.py'), 'orchestrate', '--run-id', run_id], check=True)
+    pipeline.orchestrate(run_id)
 
     # Mark any spawn_request for cron agent to pick up
-    for req in (AGENTS / run_id).glob('*/inbox/spawn_request.json'):
-        ready = req.parent / 'spawn_ready'
-        ready.write_text('ready')
+    try:
+        with os.scandir(AGENTS / run_id) as roles:
+            for role in roles:
+                if not role.is_dir(follow_symlinks=False):
+                    continue
+                inbox = Path(role.path) / 'inbox'
+                if (inbox / 'spawn_request.json').is_file():
+                    (inbox / 'spawn_ready').write_text('ready')
+    except FileNotFoundError:
+        pass
 
     # If all required outputs exist, proceed with gates -> approve -> run
     roster = load_roster()
     outputs = required_outputs(roster)
     if outputs and outputs_exist(run_id, outputs):
-        subprocess.run(['python3', str(ROOT / 'scripts' / 'pipeline.py'), 'gates', '--run-id', run_id], check=True)
-        subprocess.run(['python3', str(ROOT / 'scripts' / 'pipeline.py'), 'approve', '--run-id', run_id], check=True)
+        pipeline.run_gates(run_id)
+        pipeline.approve(run_id)
         task_path = ROOT / 'runs' / run_id / 'task.yaml'
-        subprocess.run(['python3', str(ROOT / 'scripts' / 'pipeline.py'), 'run', '--task', str(task_path)], check=True)
+        pipeline.run_task(task_path)
 
 
 if __name__ == '__main__':
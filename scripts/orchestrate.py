@@ -1,21 +1,21 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import argparse
-import subprocess
 from pathlib import Path
+import sys
 
 ROOT = Path(__file__).resolve().parents[1]
 
+sys.path.insert(0, str(ROOT / "scripts"))
+from pipeline import orchestrate  # noqa: E402
+
 
 def main():
     p = argparse.ArgumentParser(description="Sequential orchestrator (wrapper for pipeline.py orchestrate)")
     p.add_argument("--run-id", required=True)
     args = p.parse_args()
 
-    subprocess.run(
-        ["python3", str(ROOT / "scripts" / "pipeline.py"), "orchestrate", "--run-id", args.run_id],
-        check=True,
-    )
+    orchestrate(args.run_id)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+import traceback
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import auto_approve  # noqa: E402
+import cron_orchestrator  # noqa: E402
+import pipeline  # noqa: E402
+
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
+# Files the tick itself writes; reacting to them would re-trigger forever.
+# Only agent-produced changes (status.json, outbox/, role outputs) matter.
+IGNORED_NAMES = {"spawn_ready", "CHECKLIST.md"}
+IGNORED_DIRS = {"inbox"}
+
+
+def watch_filter(change, path: str) -> bool:
+    p = Path(path)
+    if p.name in IGNORED_NAMES or p.name.startswith("."):
+        return False
+    return IGNORED_DIRS.isdisjoint(p.parent.parts)
+
+
+def tick():
+    # Same work as one cron invocation of each script, without the restart.
+    # Directories may have been removed (cleanup, archiving) since last tick.
+    pipeline.forget_dirs()
+    for step in (cron_orchestrator.main, auto_approve.main):
+        try:
+            step()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"{step.__module__}: {e.code}", file=sys.stderr)
+        except Exception:
+            traceback.print_exc()
+    # Close (and flush) log handles so rotated or removed logs are reopened next tick
+    pipeline.close_logs()
+
+
+async def watch_events(queue: asyncio.Queue, paths: list[Path]):
+    async for _ in awatch(*paths, watch_filter=watch_filter):
+        queue.put_nowait(None)
+
+
+async def poll_events(queue: asyncio.Queue, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        queue.put_nowait(None)
+
+
+async def run(debounce: float, interval: float):
+    queue: asyncio.Queue = asyncio.Queue()
+    paths = [p for p in (cron_orchestrator.ORCH_RUNS, cron_orchestrator.AGENTS) if p.exists()]
+    if awatch and paths:
+        producer = watch_events(queue, paths)
+    else:
+        # watchfiles not installed (or nothing to watch yet): fall back to polling
+        producer = poll_events(queue, interval)
+    producer_task = asyncio.create_task(producer)
+
+    queue.put_nowait(None)  # initial tick on startup
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, producer_task}, return_when=asyncio.FIRST_COMPLETED)
+            if producer_task in done:
+                # The watcher died (or its paths went away); keep ticking by polling
+                getter.cancel()
+                exc = producer_task.exception()
+                if exc is not None:
+                    traceback.print_exception(exc)
+                print("watcher stopped; falling back to polling", file=sys.stderr)
+                producer_task = asyncio.create_task(poll_events(queue, interval))
+                queue.put_nowait(None)  # events may have been missed meanwhile
+                continue
+            # Collapse a burst of filesystem events into a single tick
+            await asyncio.sleep(debounce)
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.to_thread(tick)
+    finally:
+        producer_task.cancel()
+
+
+def main():
+    p = argparse.ArgumentParser(description="Event-driven replacement for the orchestrator/auto-approve cron jobs")
+    p.add_argument("--debounce", type=float, default=2.0, help="seconds to coalesce event bursts")
+    p.add_argument("--interval", type=float, default=60.0, help="poll interval when watchfiles is unavailable")
+    args = p.parse_args()
+
+    try:
+        asyncio.run(run(args.debounce, args.interval))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()